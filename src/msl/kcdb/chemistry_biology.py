@@ -26,9 +26,8 @@ class ChemistryBiology(KCDB):
         Returns:
             A list of [Analyte][msl.kcdb.classes.Analyte]s
         """
-        response = http.get(f"{KCDB.BASE_URL}/referenceData/analyte", timeout=self._timeout)
-        response.raise_for_status()
-        return [Analyte(**data) for data in response.json()["referenceData"]]
+        items = self._get(f"{KCDB.BASE_URL}/referenceData/analyte")
+        return [Analyte(**data) for data in items]
 
     def categories(self) -> list[Category]:
         """Return all Chemistry and Biology categories.
@@ -36,9 +35,8 @@ class ChemistryBiology(KCDB):
         Returns:
             A list of [Category][msl.kcdb.classes.Category]'s
         """
-        response = http.get(f"{KCDB.BASE_URL}/referenceData/category", timeout=self._timeout)
-        response.raise_for_status()
-        return [Category(**data) for data in response.json()["referenceData"]]
+        items = self._get(f"{KCDB.BASE_URL}/referenceData/category")
+        return [Category(**data) for data in items]
 
     def search(
         self,
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import os
 import re
+import time
+from contextlib import suppress
 from dataclasses import dataclass
 from enum import Enum
+from hashlib import sha256
+from http.client import HTTPException
+from pathlib import Path
 from typing import TYPE_CHECKING, TypeVar
 
 from . import http
@@ -38,6 +44,15 @@ class UncertaintyConvention(Enum):
     TWO: str = "Two"
 
 
+# Lookup tables to convert a value returned by the KCDB API into an Enum member.
+# A dict lookup avoids the overhead of calling the Enum class for every result.
+_ABSOLUTE_RELATIVE: dict[str, AbsoluteRelative] = {m.value: m for m in AbsoluteRelative}
+_UNCERTAINTY_CONVENTION: dict[str, UncertaintyConvention] = {m.value: m for m in UncertaintyConvention}
+
+# A pattern without these characters matches the same text as a substring test does
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
 @dataclass(frozen=True, order=True)
 class Domain:
     """The domain of either General Physics, Chemistry and Biology or Ionizing Radiation.
@@ -194,6 +209,8 @@ class ResultAggregation:
         values: Aggregation values. _Example:_ `["Kazakhstan", "Portugal", "Greece"]`
     """
 
+    __slots__ = ("name", "values")
+
     def __init__(self, kwargs: dict[str, Any]) -> None:
         """Representation of an aggregation."""
         self.name: str = kwargs.get("name") or ""
@@ -212,6 +229,8 @@ class ResultEquation:
         equation_comment: Equation comment.
     """
 
+    __slots__ = ("equation", "equation_comment")
+
     def __init__(self, kwargs: dict[str, Any]) -> None:
         """Representation of an equation."""
         self.equation: str = kwargs.get("equation") or ""
@@ -233,6 +252,8 @@ class ResultFilter:
         order: Filter order.
     """
 
+    __slots__ = ("children", "code", "count", "name", "order")
+
     def __init__(self, kwargs: dict[str, Any]) -> None:
         """Representation of a filter."""
         self.children: list[ResultFilter] = [ResultFilter(c) for c in kwargs.get("children", [])]
@@ -257,6 +278,8 @@ class ResultParam:
         parameter_value: Parameter value. _Example:_ `"-80 dB to 0 dB"`
     """
 
+    __slots__ = ("parameter_name", "parameter_value")
+
     def __init__(self, kwargs: dict[str, Any]) -> None:
         """Representation of a parameter."""
         self.parameter_name: str = kwargs.get("parameterName") or ""
@@ -278,6 +301,8 @@ class ResultTable:
         table_contents: Table contents. _Example:_ `"{"row_1":{"col_1":"val1","col_2":"val2"}}"`
     """
 
+    __slots__ = ("table_cols", "table_comment", "table_contents", "table_name", "table_rows")
+
     def __init__(self, kwargs: dict[str, Any]) -> None:
         """Representation of a table."""
         self.table_rows: int = kwargs["tableRows"]
@@ -303,6 +328,8 @@ class ResultUnit:
         upper_limit: Upper limit value.
     """
 
+    __slots__ = ("lower_limit", "unit", "upper_limit")
+
     def __init__(self, kwargs: dict[str, Any]) -> None:
         """Units object definition."""
         self.lower_limit: float | None = kwargs.get("lowerLimit")
@@ -326,6 +353,8 @@ class Results:
         version_api_kcdb: KCDB API version. _Example:_ `"1.0.7"`
     """
 
+    __slots__ = ("number_of_elements", "page_number", "page_size", "total_elements", "total_pages", "version_api_kcdb")
+
     def __init__(self, kwargs: dict[str, Any]) -> None:
         """Attributes for advanced search results."""
         self.number_of_elements: int = kwargs["numberOfElements"]
@@ -380,6 +409,36 @@ class ResultCommon:
         uncertainty_table: Uncertainty table.
     """
 
+    __slots__ = (
+        "approval_date",
+        "cmc",
+        "cmc_base_unit",
+        "cmc_uncertainty",
+        "cmc_uncertainty_base_unit",
+        "comments",
+        "confidence_level",
+        "country_value",
+        "coverage_factor",
+        "domain_code",
+        "group_identifier",
+        "id",
+        "kcdb_code",
+        "metrology_area_label",
+        "nmi_code",
+        "nmi_name",
+        "nmi_service_code",
+        "nmi_service_link",
+        "publication_date",
+        "quantity_value",
+        "rmo",
+        "status",
+        "status_date",
+        "traceability_source",
+        "uncertainty_equation",
+        "uncertainty_mode",
+        "uncertainty_table",
+    )
+
     def __init__(self, kwargs: dict[str, Any]) -> None:
         """Attributes for advanced search results that are common."""
         self.id: int = kwargs["id"]
@@ -420,7 +479,7 @@ class ResultCommon:
         self.uncertainty_equation: ResultEquation | None = ResultEquation(k) if k else None
 
         k = kwargs.get("uncertaintyMode")
-        self.uncertainty_mode: AbsoluteRelative | None = AbsoluteRelative(k) if k else None
+        self.uncertainty_mode: AbsoluteRelative | None = _ABSOLUTE_RELATIVE.get(k) if k else None
 
         k = kwargs.get("uncertaintyTable")
         self.uncertainty_table: ResultTable | None = ResultTable(k) if k else None
@@ -447,6 +506,23 @@ class ResultChemistryBiology(ResultCommon):
         uncertainty_convention: Uncertainty convention.
     """
 
+    __slots__ = (
+        "analyte_matrix",
+        "analyte_value",
+        "category_value",
+        "crm",
+        "crm_confidence_level",
+        "crm_coverage_factor",
+        "crm_uncertainty",
+        "crm_uncertainty_equation",
+        "crm_uncertainty_mode",
+        "crm_uncertainty_table",
+        "measurement_technique",
+        "mechanism",
+        "sub_category_value",
+        "uncertainty_convention",
+    )
+
     def __init__(self, kwargs: dict[str, Any]) -> None:
         """Chemistry and Biology result."""
         super().__init__(kwargs)
@@ -468,7 +544,7 @@ class ResultChemistryBiology(ResultCommon):
         self.crm_uncertainty_equation: ResultEquation | None = ResultEquation(k) if k else None
 
         k = kwargs.get("crmUncertaintyMode")
-        self.crm_uncertainty_mode: AbsoluteRelative | None = AbsoluteRelative(k) if k else None
+        self.crm_uncertainty_mode: AbsoluteRelative | None = _ABSOLUTE_RELATIVE.get(k) if k else None
 
         k = kwargs.get("crmUncertaintyTable")
         self.crm_uncertainty_table: ResultTable | None = ResultTable(k) if k else None
@@ -479,7 +555,7 @@ class ResultChemistryBiology(ResultCommon):
         self.sub_category_value: str = kwargs.get("subCategoryValue") or ""
 
         k = kwargs.get("uncertaintyConvention")
-        self.uncertainty_convention: UncertaintyConvention | None = UncertaintyConvention(k) if k else None
+        self.uncertainty_convention: UncertaintyConvention | None = _UNCERTAINTY_CONVENTION.get(k) if k else None
 
     def __repr__(self) -> str:
         """Return the object representation."""
@@ -501,6 +577,17 @@ class ResultGeneralPhysics(ResultCommon):
         sub_service_value: Sub service value. _Example:_ `"Scattering parameters (vectors)"`
     """
 
+    __slots__ = (
+        "branch_value",
+        "individual_service_value",
+        "instrument",
+        "instrument_method",
+        "international_standard",
+        "parameters",
+        "service_value",
+        "sub_service_value",
+    )
+
     def __init__(self, kwargs: dict[str, Any]) -> None:
         """General Physics result."""
         super().__init__(kwargs)
@@ -535,6 +622,19 @@ class ResultIonizingRadiation(ResultCommon):
         source_value: Source value. _Example:_ `"Multi-radionuclide source"`
     """
 
+    __slots__ = (
+        "branch_value",
+        "instrument",
+        "instrument_method",
+        "international_standard",
+        "medium_value",
+        "nuclide_value",
+        "radiation_code",
+        "radiation_specification",
+        "reference_standard",
+        "source_value",
+    )
+
     def __init__(self, kwargs: dict[str, Any]) -> None:
         """Ionizing Radiation result."""
         super().__init__(kwargs)
@@ -561,6 +661,8 @@ class ResultsChemistryBiology(Results):
         data: Chemistry and Biology result data.
     """
 
+    __slots__ = ("data",)
+
     def __init__(self, kwargs: dict[str, Any]) -> None:
         """Chemistry and Biology search results."""
         super().__init__(kwargs)
@@ -578,6 +680,8 @@ class ResultsGeneralPhysics(Results):
         data: General Physics result data.
     """
 
+    __slots__ = ("data",)
+
     def __init__(self, kwargs: dict[str, Any]) -> None:
         """General Physics search results."""
         super().__init__(kwargs)
@@ -597,6 +701,8 @@ class ResultsQuickSearch(Results):
         filters_list: The filters list.
     """
 
+    __slots__ = ("aggregations", "data", "filters_list")
+
     def __init__(self, kwargs: dict[str, Any]) -> None:
         """Quick search results."""
         super().__init__(kwargs)
@@ -620,6 +726,8 @@ class ResultsIonizingRadiation(Results):
         data: Ionizing Radiation result data.
     """
 
+    __slots__ = ("data",)
+
     def __init__(self, kwargs: dict[str, Any]) -> None:
         """Ionizing Radiation search results."""
         super().__init__(kwargs)
@@ -644,27 +752,117 @@ class KCDB:
 
     DOMAIN: Domain
 
-    def __init__(self, timeout: float | None = 30) -> None:
+    def __init__(
+        self,
+        timeout: float | None = 30,
+        *,
+        cache_dir: str | Path | None = None,
+        cache_ttl: float = 43_200,
+        allow_stale: bool = False,
+    ) -> None:
         """Initialise the KCDB base class.
 
         Args:
             timeout: The maximum number of seconds to wait for a response from the KCDB server.
+            cache_dir: A directory to cache the reference data (e.g., countries, branches, nuclides)
+                that is returned by the KCDB server. The reference data rarely changes, so reading it
+                from a file avoids sending a request to the KCDB server. If `None`, reference data
+                is not cached to disk. Reference data is always cached in memory by an instance of
+                this class. Search results are never cached.
+            cache_ttl: The number of seconds that cached reference data is valid for (default is 12 hours).
+            allow_stale: Whether to return reference data from the `cache_dir`, even if it has expired,
+                when the request to the KCDB server fails (e.g., the server cannot be reached).
         """
         self.timeout = timeout
+        self._cache_dir = None if cache_dir is None else Path(cache_dir).expanduser()
+        self._cache_ttl = cache_ttl
+        self._allow_stale = allow_stale
+        self._cache: dict[str, Any] = {}
 
     def __repr__(self) -> str:
         """Return the object representation."""
         return f"{self.__class__.__name__}(code={self.DOMAIN.code!r}, name={self.DOMAIN.name!r})"
 
+    @staticmethod
+    def _cache_key(url: str, params: dict[str, int | str] | None) -> str:
+        """Return the key to use to cache the reference data of a GET request."""
+        return url if not params else f"{url}?{sorted(params.items())}"
+
     @staticmethod
     def _check_page_info(page: int, page_size: int) -> None:
+        if page >= 0 and 1 <= page_size <= KCDB.MAX_PAGE_SIZE:
+            return
+
         if page < 0:
             msg = f"Invalid page value, {page}. Must be >= 0"
-            raise ValueError(msg)
-
-        if page_size < 1 or page_size > KCDB.MAX_PAGE_SIZE:
+        else:
             msg = f"Invalid page size, {page_size}. Must be in the range [1, {KCDB.MAX_PAGE_SIZE}]"
-            raise ValueError(msg)
+        raise ValueError(msg)
+
+    def _get(
+        self,
+        url: str,
+        *,
+        params: dict[str, int | str] | None = None,
+        key: str = "referenceData",
+        missing_ok: bool = False,
+    ) -> Any:  # noqa: ANN401
+        """Send a GET request for reference data, or read it from the cache.
+
+        If `missing_ok` is True and the KCDB server replies with HTTP error 404, None is returned.
+        """
+        name = self._cache_key(url, params)
+        data = self._cache.get(name)
+        if data is not None:
+            return data[key]
+
+        file = None
+        if self._cache_dir is not None:
+            file = self._cache_dir / f"{sha256(name.encode()).hexdigest()}.json"
+            with suppress(OSError):
+                if time.time() - file.stat().st_mtime < self._cache_ttl:
+                    data = self._read_cache(file, key)
+                    if data is not None:
+                        self._cache[name] = data
+                        return data[key]
+
+        try:
+            response = http.get(url, params=params, timeout=self._timeout)
+            if missing_ok and response.status_code == 404:  # noqa: PLR2004
+                return None
+            response.raise_for_status()
+            # parse the response before it is cached, so that a response that is not
+            # valid reference data (e.g., a maintenance page) is never written to a file
+            data = response.json()
+            items = data[key]
+        except (HTTPException, OSError, KeyError, TypeError, ValueError):
+            data = None if file is None or not self._allow_stale else self._read_cache(file, key)
+            if data is None:
+                raise
+            self._cache[name] = data
+            return data[key]
+
+        if file is not None:
+            # write to a temporary file first so that another process never reads a partial file
+            with suppress(OSError):
+                file.parent.mkdir(parents=True, exist_ok=True)
+                tmp = file.with_suffix(f".{os.getpid()}.tmp")
+                tmp.write_bytes(response.content)
+                tmp.replace(file)
+
+        self._cache[name] = data
+        return items
+
+    @staticmethod
+    def _read_cache(file: Path, key: str) -> Any:  # noqa: ANN401
+        """Read reference data from a cache file, returns None if the file cannot be read or is invalid."""
+        try:
+            data = http.loads(file.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or key not in data:
+            return None
+        return data
 
     @staticmethod
     def _to_countries(countries: str | Country | Iterable[str | Country]) -> list[str]:
@@ -686,15 +884,22 @@ class KCDB:
             return obj
         return obj.physics_code
 
+    def clear_cache(self) -> None:
+        """Clear the reference data that is cached in memory.
+
+        The next request for reference data is read from the `cache_dir` (if the
+        cached file has not expired) or is sent to the KCDB server.
+        """
+        self._cache.clear()
+
     def countries(self) -> list[Country]:
         """Return all countries.
 
         Returns:
             A list of [Country][msl.kcdb.classes.Country]'s.
         """
-        response = http.get(f"{KCDB.BASE_URL}/referenceData/country", timeout=self._timeout)
-        response.raise_for_status()
-        return [Country(**data) for data in response.json()["referenceData"]]
+        items = self._get(f"{KCDB.BASE_URL}/referenceData/country")
+        return [Country(**data) for data in items]
 
     def domains(self) -> list[Domain]:
         """Return all KCDB domains.
@@ -702,23 +907,27 @@ class KCDB:
         Returns:
             A list of [Domain][msl.kcdb.classes.Domain]s.
         """
-        response = http.get(f"{KCDB.BASE_URL}/referenceData/domain", timeout=self._timeout)
-        response.raise_for_status()
-        return [Domain(**data) for data in response.json()["domains"]]
+        items = self._get(f"{KCDB.BASE_URL}/referenceData/domain", key="domains")
+        return [Domain(**data) for data in items]
 
     @staticmethod
-    def filter(data: Iterable[T], pattern: str, *, flags: int = 0) -> list[T]:
+    def filter(data: Iterable[T], pattern: str | re.Pattern[str], *, flags: int = 0) -> list[T]:
         """Filter the reference data based on a pattern search.
 
         Args:
             data: An iterable of a [ReferenceData][msl.kcdb.classes.ReferenceData] subclass.
             pattern: A regular-expression pattern to use to filter results. Uses the `label`
                 and `value` attributes of each item in `data` to perform the filtering.
-            flags: Pattern flags passed to [re.compile][].
+                A compiled pattern is used as is, which avoids compiling the same pattern
+                again when filtering many times.
+            flags: Pattern flags passed to [re.compile][]. Must be 0 if `pattern` is compiled.
 
         Returns:
             The filtered reference data.
         """
+        if flags == 0 and isinstance(pattern, str) and _REGEX_METACHARACTERS.isdisjoint(pattern):
+            return [item for item in data if pattern in item.value or pattern in item.label]
+
         regex = re.compile(pattern, flags=flags)
         return [item for item in data if regex.search(item.value) or regex.search(item.label)]
 
@@ -728,13 +937,8 @@ class KCDB:
         Returns:
             A list of [MetrologyArea][msl.kcdb.classes.MetrologyArea]s.
         """
-        response = http.get(
-            f"{KCDB.BASE_URL}/referenceData/metrologyArea",
-            params={"domainCode": self.DOMAIN.code},
-            timeout=self._timeout,
-        )
-        response.raise_for_status()
-        return [MetrologyArea(domain=self.DOMAIN, **data) for data in response.json()["referenceData"]]
+        items = self._get(f"{KCDB.BASE_URL}/referenceData/metrologyArea", params={"domainCode": self.DOMAIN.code})
+        return [MetrologyArea(domain=self.DOMAIN, **data) for data in items]
 
     def non_ionizing_quantities(self) -> list[NonIonizingQuantity]:
         """Return all non-Ionizing Radiation quantities.
@@ -742,13 +946,8 @@ class KCDB:
         Returns:
             A list of [NonIonizingQuantity][msl.kcdb.classes.NonIonizingQuantity]'s.
         """
-        response = http.get(f"{KCDB.BASE_URL}/referenceData/quantity", timeout=self._timeout)
-        response.raise_for_status()
-        return [
-            NonIonizingQuantity(id=d["id"], label="", value=d["value"])
-            for d in response.json()["referenceData"]
-            if d["label"] is None
-        ]
+        items = self._get(f"{KCDB.BASE_URL}/referenceData/quantity")
+        return [NonIonizingQuantity(id=d["id"], label="", value=d["value"]) for d in items if d["label"] is None]
 
     def quick_search(
         self,
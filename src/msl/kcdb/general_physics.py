@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 from . import http
@@ -29,17 +30,12 @@ class GeneralPhysics(KCDB):
         Returns:
             A list of [Branch][msl.kcdb.classes.Branch]es.
         """
-        if metrology_area.label in ["QM", "RI"]:
+        if metrology_area.domain.code != self.DOMAIN.code:
             # ignore CHEM-BIO and RADIATION
             return []
 
-        response = http.get(
-            f"{KCDB.BASE_URL}/referenceData/branch",
-            params={"areaId": metrology_area.id},
-            timeout=self._timeout,
-        )
-        response.raise_for_status()
-        return [Branch(metrology_area=metrology_area, **data) for data in response.json()["referenceData"]]
+        items = self._get(f"{KCDB.BASE_URL}/referenceData/branch", params={"areaId": metrology_area.id})
+        return [Branch(metrology_area=metrology_area, **data) for data in items]
 
     def individual_services(self, sub_service: SubService) -> list[IndividualService]:
         """Return all General Physics individual services for the specified sub service.
@@ -50,25 +46,25 @@ class GeneralPhysics(KCDB):
         Returns:
             A list of [IndividualService][msl.kcdb.classes.IndividualService]s.
         """
-        response = http.get(
-            f"{KCDB.BASE_URL}/referenceData/individualService",
-            params={"subServiceId": sub_service.id},
-            timeout=self._timeout,
-        )
-        if response.ok:
-            return [
-                IndividualService(
-                    sub_service=sub_service,
-                    physics_code=f"{sub_service.physics_code}.{data['label']}",
-                    **data,
-                )
-                for data in response.json()["referenceData"]
-            ]
-
-        # When this method was written, "Not attributed 1" and "Fibre Polarization mode dispersion (inactive)"
-        # did not have Individual Services and HTTP error 404 was returned from the API
-        assert sub_service.id in [104, 151]  # noqa: S101
-        return []
+        url = f"{KCDB.BASE_URL}/referenceData/individualService"
+        params: dict[str, int | str] = {"subServiceId": sub_service.id}
+        items = self._get(url, params=params, missing_ok=True)
+        if items is None:
+            # When this method was written, "Not attributed 1" and "Fibre Polarization mode dispersion (inactive)"
+            # did not have Individual Services and HTTP error 404 was returned from the API
+            assert sub_service.id in [104, 151]  # noqa: S101
+            # remember that there are no Individual Services, so that the request is not sent again
+            self._cache[self._cache_key(url, params)] = {"referenceData": []}
+            return []
+
+        return [
+            IndividualService(
+                sub_service=sub_service,
+                physics_code=f"{sub_service.physics_code}.{data['label']}",
+                **data,
+            )
+            for data in items
+        ]
 
     def search(
         self,
@@ -147,17 +143,12 @@ class GeneralPhysics(KCDB):
         Returns:
             A list of [Service][msl.kcdb.classes.Service]s.
         """
-        if branch.id in [32, 33, 34]:
-            # Dosimetry(id=32), Radioactivity(id=33) and Neutron Measurements(id=34) do not have Services
+        if branch.metrology_area.domain.code != self.DOMAIN.code:
+            # ignore CHEM-BIO and RADIATION (e.g., Dosimetry, Radioactivity and Neutron Measurements)
             return []
 
-        response = http.get(
-            f"{KCDB.BASE_URL}/referenceData/service",
-            params={"branchId": branch.id},
-            timeout=self._timeout,
-        )
-        response.raise_for_status()
-        return [Service(branch=branch, physics_code=data["label"], **data) for data in response.json()["referenceData"]]
+        items = self._get(f"{KCDB.BASE_URL}/referenceData/service", params={"branchId": branch.id})
+        return [Service(branch=branch, physics_code=data["label"], **data) for data in items]
 
     def sub_services(self, service: Service) -> list[SubService]:
         """Return all General Physics sub services for the specified service.
@@ -168,13 +159,40 @@ class GeneralPhysics(KCDB):
         Returns:
             A list of [SubService][msl.kcdb.classes.SubService]s.
         """
-        response = http.get(
-            f"{KCDB.BASE_URL}/referenceData/subService",
-            params={"serviceId": service.id},
-            timeout=self._timeout,
-        )
-        response.raise_for_status()
+        items = self._get(f"{KCDB.BASE_URL}/referenceData/subService", params={"serviceId": service.id})
         return [
             SubService(service=service, physics_code=f"{service.physics_code}.{data['label']}", **data)
-            for data in response.json()["referenceData"]
+            for data in items
         ]
+
+    def tree(
+        self, metrology_area: MetrologyArea, *, max_workers: int | None = 8
+    ) -> dict[Branch, dict[Service, dict[SubService, list[IndividualService]]]]:
+        """Return all General Physics branches, services, sub services and individual services of a metrology area.
+
+        The requests for each level of the tree (services, sub services, individual services) are
+        sent concurrently, which is faster than calling
+        [services][msl.kcdb.general_physics.GeneralPhysics.services],
+        [sub_services][msl.kcdb.general_physics.GeneralPhysics.sub_services] and
+        [individual_services][msl.kcdb.general_physics.GeneralPhysics.individual_services]
+        for each item of the level above.
+
+        Args:
+            metrology_area: The metrology area to return the tree for.
+            max_workers: The maximum number of requests that are sent concurrently.
+
+        Returns:
+            A nested dictionary, `{Branch: {Service: {SubService: [IndividualService, ...]}}}`.
+        """
+        branches = self.branches(metrology_area)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            services = dict(zip(branches, executor.map(self.services, branches)))
+            all_services = [s for values in services.values() for s in values]
+            sub_services = dict(zip(all_services, executor.map(self.sub_services, all_services)))
+            all_sub_services = [s for values in sub_services.values() for s in values]
+            individual = dict(zip(all_sub_services, executor.map(self.individual_services, all_sub_services)))
+
+        return {
+            branch: {service: {sub: individual[sub] for sub in sub_services[service]} for service in services[branch]}
+            for branch in branches
+        }
@@ -2,36 +2,80 @@
 
 We could use a third-party package like "requests" or "httpx" but since the
 KCDB API is so basic (e.g., no authentication is required, trivial GET parameters),
-the builtin urllib module is sufficient.
+the builtin http.client module is sufficient.
+
+Connections to the KCDB server are kept alive and reused by subsequent requests
+(per thread) to avoid the cost of a TCP and TLS handshake for every request. The
+connections of a thread are closed when the thread exits (or when the interpreter exits).
+
+Responses are requested to be gzip compressed, since the JSON data that is returned
+by a search can be large and it compresses well.
+
+A proxy server is used if one is configured by the environment (e.g., the HTTPS_PROXY,
+HTTP_PROXY and NO_PROXY environment variables), as urllib.request.urlopen() would, and
+redirects are followed.
+
+If the optional "orjson" package is installed, it is used to serialize and
+deserialize JSON since it is faster than the builtin json module.
 """
 
 from __future__ import annotations
 
+import gzip
 import json as _json
-from http.client import HTTPException
+import threading
+import weakref
+from base64 import b64encode
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
 from typing import TYPE_CHECKING
-from urllib.error import HTTPError
-from urllib.request import Request, urlopen
+from urllib.parse import unquote, urlencode, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
 
 from ._version import __version__
 
+try:
+    import orjson
+except ImportError:
+    _HAS_ORJSON = False
+else:
+    _HAS_ORJSON = True
+
 if TYPE_CHECKING:
+    from email.message import Message
     from http.client import HTTPResponse
     from typing import Any
 
 HEADERS: dict[str, str] = {
     "User-Agent": f"msl-kcdb/{__version__}",
     "Accept": "application/json",
+    "Accept-Encoding": "gzip",
     "Content-Type": "application/json",
 }
 
+# Same as urllib.request.HTTPRedirectHandler
+_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 10
+
+_local = threading.local()
+
 
 class _Response:
-    def __init__(self, response: HTTPResponse | HTTPError) -> None:
-        self._url = response.url
-        self._code = 0 if response.status is None else response.status
+    def __init__(self, url: str, response: HTTPResponse) -> None:
+        self._url = url
+        self._code = response.status
         self._reason = response.reason
+        self._headers = response.headers
         self._data = response.read()
+        if response.getheader("Content-Encoding") == "gzip":
+            self._data = gzip.decompress(self._data)
+
+    @property
+    def content(self) -> bytes:
+        return self._data
+
+    @property
+    def headers(self) -> Message:
+        return self._headers
 
     @property
     def ok(self) -> bool:
@@ -50,7 +94,25 @@ class _Response:
             raise HTTPException(msg)
 
     def json(self) -> Any:  # noqa: ANN401
-        return _json.loads(self._data)
+        return loads(self._data)
+
+    @property
+    def status_code(self) -> int:
+        return self._code
+
+
+def loads(data: bytes) -> Any:  # noqa: ANN401
+    """Deserialize JSON data.
+
+    Args:
+        data: The JSON data.
+
+    Returns:
+        The deserialized Python object.
+    """
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return _json.loads(data)
 
 
 def get(
@@ -95,6 +157,75 @@ def post(
     return _request(url=url, method="POST", json=json, params=params, timeout=timeout)
 
 
+class _Connections:
+    """The connections of a thread, which are closed when the thread (or the interpreter) exits."""
+
+    def __init__(self) -> None:
+        self.connections: dict[tuple[str, str, str], HTTPConnection] = {}
+        # the thread-local storage of a thread is deleted when the thread exits
+        _ = weakref.finalize(self, _close, self.connections)
+
+
+def _connection(scheme: str, netloc: str, timeout: float | None, proxy: str) -> HTTPConnection:
+    """Return a (possibly already open) connection to a server (or to a proxy) for the calling thread."""
+    connections = _connections()
+    conn = connections.get((scheme, netloc, proxy))
+    if conn is None:
+        if not proxy:
+            cls = HTTPSConnection if scheme == "https" else HTTPConnection
+            conn = cls(netloc, timeout=timeout)
+        elif scheme == "https":
+            # the proxy tunnels the (encrypted) connection to the server
+            conn = HTTPSConnection(_proxy_address(proxy), timeout=timeout)
+            conn.set_tunnel(netloc, headers=_proxy_headers(proxy))
+        else:
+            conn = HTTPConnection(_proxy_address(proxy), timeout=timeout)
+        connections[(scheme, netloc, proxy)] = conn
+    else:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+    return conn
+
+
+def _close(connections: dict[tuple[str, str, str], HTTPConnection]) -> None:
+    """Close connections."""
+    for conn in connections.values():
+        conn.close()
+    connections.clear()
+
+
+def _connections() -> dict[tuple[str, str, str], HTTPConnection]:
+    """Return the connections of the calling thread."""
+    holder: _Connections | None = getattr(_local, "holder", None)
+    if holder is None:
+        holder = _Connections()
+        _local.holder = holder
+    return holder.connections
+
+
+def _proxy(scheme: str, netloc: str) -> str:
+    """Return the url of the proxy to use for a server, or an empty string if a proxy is not used."""
+    proxy = getproxies().get(scheme)
+    if not proxy or proxy_bypass(netloc):
+        return ""
+    return proxy if "://" in proxy else f"http://{proxy}"
+
+
+def _proxy_address(proxy: str) -> str:
+    """Return the host[:port] of a proxy url (without the user credentials)."""
+    return urlsplit(proxy).netloc.rpartition("@")[2]
+
+
+def _proxy_headers(proxy: str) -> dict[str, str]:
+    """Return the headers to authenticate with a proxy, if the proxy url contains user credentials."""
+    parts = urlsplit(proxy)
+    if parts.username is None:
+        return {}
+    credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+    return {"Proxy-Authorization": f"Basic {b64encode(credentials.encode()).decode()}"}
+
+
 def _request(
     *,
     url: str,
@@ -103,24 +234,57 @@ def _request(
     params: dict[str, int | str] | None = None,
     timeout: float | None = 30,
 ) -> _Response:
-    """Send a request."""
+    """Send a request, following redirects."""
     if params:
-        # The KCDB API values are either an integer or a domain-code string
-        # (which does not contain spaces and only letters A-Z or a hyphen),
-        # so there is no need to convert the key-value pairs to be URL safe,
-        # using urllib.parse.quote_plus(), since they already are safe.
-        url += "?" + "&".join(f"{key}={value}" for key, value in params.items())
-
-    data = _json.dumps(json).encode("utf-8") if json else None
-
-    try:
-        with urlopen(Request(url, headers=HEADERS, data=data, method=method), timeout=timeout) as response:  # noqa: S310
-            return _Response(response)
-    except HTTPError as e:
-        return _Response(e)
-    except OSError as e:
-        if "timed out" not in str(e):
-            raise
+        url += "?" + urlencode(params)
+
+    data: bytes | None = None
+    if json:
+        data = orjson.dumps(json) if _HAS_ORJSON else _json.dumps(json).encode("utf-8")
+
+    for _ in range(_MAX_REDIRECTS + 1):
+        response = _send(url=url, method=method, data=data, timeout=timeout)
+        location = response.headers.get("Location")
+        if response.status_code not in _REDIRECT_CODES or not location:
+            return response
+
+        url = urljoin(url, location)
+        if response.status_code == 303 or (response.status_code in {301, 302} and method == "POST"):  # noqa: PLR2004
+            # same as the browsers (and urllib) do, the redirected request is a GET request without a body
+            method, data = "GET", None
+
+    msg = f"Too many redirects, url={url!r}"
+    raise HTTPException(msg)
+
+
+def _send(*, url: str, method: str, data: bytes | None, timeout: float | None) -> _Response:
+    """Send a request."""
+    parts = urlsplit(url)
+    proxy = _proxy(parts.scheme, parts.netloc)
+    headers = HEADERS
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    if proxy and parts.scheme == "http":
+        # the proxy forwards the request, so the request must contain the absolute url
+        headers = {**HEADERS, **_proxy_headers(proxy)}
+        path = parts._replace(fragment="").geturl()
+
+    while True:
+        conn = _connection(parts.scheme, parts.netloc, timeout, proxy)
+        reused = conn.sock is not None
+        try:
+            conn.request(method, path, body=data, headers=headers)
+            return _Response(url, conn.getresponse())
+        except (ConnectionError, HTTPException):
+            conn.close()
+            # The server may have closed an idle keep-alive connection,
+            # in which case the request is sent again on a new connection
+            if not reused:
+                raise
+        except OSError as e:
+            conn.close()
+            if "timed out" not in str(e):
+                raise
+            break
 
     msg = f"No reply from KCDB server after {timeout} seconds"
     raise TimeoutError(msg)
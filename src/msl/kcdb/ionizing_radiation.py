@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING
 
 from . import http
@@ -10,6 +11,7 @@ from .classes import KCDB, Branch, Domain, Medium, Nuclide, Quantity, ResultsIon
 if TYPE_CHECKING:
     from collections.abc import Iterable
     from datetime import date
+    from typing import ClassVar
 
     from .classes import Country, MetrologyArea
 
@@ -20,6 +22,23 @@ class IonizingRadiation(KCDB):
     DOMAIN = Domain(code="RADIATION", name="Ionizing radiation")
     """The Ionizing Radiation domain."""
 
+    # The range of ids of the mediums, quantities and sources that belong to each Branch
+    _MEDIUM_IDS: ClassVar[dict[str, range]] = {
+        "RAD": range(17),
+        "DOS": range(17, 24),
+        "NEU": range(24, sys.maxsize),
+    }
+    _QUANTITY_IDS: ClassVar[dict[str, range]] = {
+        "DOS": range(32),
+        "RAD": range(32, 47),
+        "NEU": range(47, 78),
+    }
+    _SOURCE_IDS: ClassVar[dict[str, range]] = {
+        "DOS": range(32),
+        "RAD": range(32, 35),
+        "NEU": range(35, sys.maxsize),
+    }
+
     def branches(self, metrology_area: MetrologyArea) -> list[Branch]:
         """Return all Ionizing Radiation branches for the specified metrology area.
 
@@ -29,17 +48,12 @@ class IonizingRadiation(KCDB):
         Returns:
             A list of [Branch][msl.kcdb.classes.Branch]es.
         """
-        if metrology_area.id < 9:  # noqa: PLR2004
+        if metrology_area.domain.code != self.DOMAIN.code:
             # ignore PHYSICS and CHEM-BIO
             return []
 
-        response = http.get(
-            f"{KCDB.BASE_URL}/referenceData/branch",
-            params={"areaId": metrology_area.id},
-            timeout=self._timeout,
-        )
-        response.raise_for_status()
-        return [Branch(metrology_area=metrology_area, **data) for data in response.json()["referenceData"]]
+        items = self._get(f"{KCDB.BASE_URL}/referenceData/branch", params={"areaId": metrology_area.id})
+        return [Branch(metrology_area=metrology_area, **data) for data in items]
 
     def mediums(self, branch: Branch) -> list[Medium]:
         """Return all Ionizing Radiation mediums for the specified branch.
@@ -52,18 +66,12 @@ class IonizingRadiation(KCDB):
         """
         # The /radiationMedium endpoint does not accept parameters, so we need to filter the mediums
         # based on the Branch that is specified
-        if branch.label not in ["RAD", "DOS", "NEU"]:
+        ids = self._MEDIUM_IDS.get(branch.label)
+        if ids is None:
             return []
 
-        response = http.get(f"{KCDB.BASE_URL}/referenceData/radiationMedium", timeout=self._timeout)
-        response.raise_for_status()
-        data = response.json()["referenceData"]
-
-        if branch.label == "RAD":
-            return [Medium(branch=branch, **d) for d in data if d["id"] < 17]  # noqa: PLR2004
-        if branch.label == "DOS":
-            return [Medium(branch=branch, **d) for d in data if 17 <= d["id"] < 24]  # noqa: PLR2004
-        return [Medium(branch=branch, **d) for d in data if d["id"] >= 24]  # noqa: PLR2004
+        items = self._get(f"{KCDB.BASE_URL}/referenceData/radiationMedium")
+        return [Medium(branch=branch, **d) for d in items if d["id"] in ids]
 
     def nuclides(self) -> list[Nuclide]:
         """Return all Ionizing Radiation nuclides.
@@ -71,9 +79,8 @@ class IonizingRadiation(KCDB):
         Returns:
             A list of [Nuclide][msl.kcdb.classes.Nuclide]s.
         """
-        response = http.get(f"{KCDB.BASE_URL}/referenceData/nuclide", timeout=self._timeout)
-        response.raise_for_status()
-        return [Nuclide(**data) for data in response.json()["referenceData"]]
+        items = self._get(f"{KCDB.BASE_URL}/referenceData/nuclide")
+        return [Nuclide(**data) for data in items]
 
     def quantities(self, branch: Branch) -> list[Quantity]:
         """Return all Ionizing Radiation quantities for the specified branch.
@@ -88,18 +95,12 @@ class IonizingRadiation(KCDB):
         # based on the Branch that is specified. There are many more quantities after id=78, but
         # these all have "label": null, so we ignore these additional quantities here and
         # provide them in KCDB.non_ionizing_quantities()
-        if branch.label not in ["RAD", "DOS", "NEU"]:
+        ids = self._QUANTITY_IDS.get(branch.label)
+        if ids is None:
             return []
 
-        response = http.get(f"{KCDB.BASE_URL}/referenceData/quantity", timeout=self._timeout)
-        response.raise_for_status()
-        data = response.json()["referenceData"]
-
-        if branch.label == "DOS":
-            return [Quantity(branch=branch, **d) for d in data if d["id"] < 32]  # noqa: PLR2004
-        if branch.label == "RAD":
-            return [Quantity(branch=branch, **d) for d in data if 32 <= d["id"] < 47]  # noqa: PLR2004
-        return [Quantity(branch=branch, **d) for d in data if 47 <= d["id"] < 78]  # noqa: PLR2004
+        items = self._get(f"{KCDB.BASE_URL}/referenceData/quantity")
+        return [Quantity(branch=branch, **d) for d in items if d["id"] in ids]
 
     def search(
         self,
@@ -194,15 +195,9 @@ class IonizingRadiation(KCDB):
         """
         # The /radiationSource endpoint does not accept parameters, so we need to filter the sources
         # based on the Branch that is specified
-        if branch.label not in ["RAD", "DOS", "NEU"]:
+        ids = self._SOURCE_IDS.get(branch.label)
+        if ids is None:
             return []
 
-        response = http.get(f"{KCDB.BASE_URL}/referenceData/radiationSource", timeout=self._timeout)
-        response.raise_for_status()
-        data = response.json()["referenceData"]
-
-        if branch.label == "DOS":
-            return [Source(branch=branch, **d) for d in data if d["id"] < 32]  # noqa: PLR2004
-        if branch.label == "RAD":
-            return [Source(branch=branch, **d) for d in data if 32 <= d["id"] < 35]  # noqa: PLR2004
-        return [Source(branch=branch, **d) for d in data if d["id"] >= 35]  # noqa: PLR2004
+        items = self._get(f"{KCDB.BASE_URL}/referenceData/radiationSource")
+        return [Source(branch=branch, **d) for d in items if d["id"] in ids]
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPException
+from typing import TYPE_CHECKING
+
+import pytest
+
+from msl.kcdb import ChemistryBiology, GeneralPhysics, IonizingRadiation, http
+from msl.kcdb.classes import KCDB
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from msl.kcdb.classes import Branch
+
+
+class FakeResponse:
+    """Fake response from the KCDB server."""
+
+    def __init__(self, url: str, content: bytes | None) -> None:
+        """Fake response from the KCDB server."""
+        self.url = url
+        self.content = content or b""
+        self.ok = content is not None
+
+    @property
+    def status_code(self) -> int:
+        """The HTTP status code."""
+        return 200 if self.ok else 404
+
+    def json(self) -> object:
+        """Deserialize the content."""
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        """Raise an exception if the url was not registered."""
+        if not self.ok:
+            msg = f"Client Error 404: reason='Not Found', url={self.url!r}"
+            raise HTTPException(msg)
+
+
+class FakeKCDB:
+    """Replaces msl.kcdb.http.get() to return reference data without connecting to the KCDB server."""
+
+    def __init__(self) -> None:
+        """Replaces msl.kcdb.http.get() to return reference data without connecting to the KCDB server."""
+        self.requested: list[str] = []
+        self._lock = threading.Lock()
+        self._responses: dict[str, bytes] = {}
+
+    def add(self, endpoint: str, data: list[dict[str, object]] | bytes, *, key: str = "referenceData") -> None:
+        """Add the reference data (or the raw body) to return for an endpoint, e.g., `"branch?areaId=7"`."""
+        content = data if isinstance(data, bytes) else json.dumps({key: data}).encode()
+        self._responses[f"{KCDB.BASE_URL}/referenceData/{endpoint}"] = content
+
+    def remove(self, endpoint: str) -> None:
+        """Remove an endpoint, so that a request to it returns a 404 error."""
+        del self._responses[f"{KCDB.BASE_URL}/referenceData/{endpoint}"]
+
+    def get(self, url: str, *, params: dict[str, int | str] | None = None, **kwargs: object) -> FakeResponse:  # noqa: ARG002
+        """Fake a GET request."""
+        if params:
+            url += "?" + "&".join(f"{k}={v}" for k, v in params.items())
+        with self._lock:
+            self.requested.append(url)
+        return FakeResponse(url, self._responses.get(url))
+
+
+@pytest.fixture(scope="session")
+def cache_dir(pytestconfig: pytest.Config) -> Path | None:
+    """A directory to cache reference data in between test sessions."""
+    cache = getattr(pytestconfig, "cache", None)  # None if the cacheprovider plugin is disabled
+    return None if cache is None else cache.mkdir("msl-kcdb")
+
+
+@pytest.fixture(scope="session")
+def chem_bio(cache_dir: Path | None) -> ChemistryBiology:
+    """A ChemistryBiology instance that is shared by all tests, so reference data is only requested once."""
+    return ChemistryBiology(cache_dir=cache_dir)
+
+
+@pytest.fixture(scope="session")
+def physics(cache_dir: Path | None) -> GeneralPhysics:
+    """A GeneralPhysics instance that is shared by all tests, so reference data is only requested once."""
+    return GeneralPhysics(cache_dir=cache_dir)
+
+
+@pytest.fixture(scope="session")
+def physics_branches(physics: GeneralPhysics) -> list[Branch]:
+    """The branches of all General Physics metrology areas, requested concurrently."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return [b for items in executor.map(physics.branches, physics.metrology_areas()) for b in items]
+
+
+@pytest.fixture(scope="session")
+def radiation(cache_dir: Path | None) -> IonizingRadiation:
+    """An IonizingRadiation instance that is shared by all tests, so reference data is only requested once."""
+    return IonizingRadiation(cache_dir=cache_dir)
+
+
+@pytest.fixture
+def no_reply(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Send requests to a local server that accepts connections but never replies."""
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        monkeypatch.setattr(KCDB, "BASE_URL", f"http://127.0.0.1:{server.getsockname()[1]}")
+        yield
+
+
+@pytest.fixture
+def fake_kcdb(monkeypatch: pytest.MonkeyPatch) -> FakeKCDB:
+    """Do not connect to the KCDB server when requesting reference data."""
+    fake = FakeKCDB()
+    monkeypatch.setattr(http, "get", fake.get)
+    return fake
@@ -9,9 +9,10 @@ from msl.kcdb import ChemistryBiology
 class TestChemBio:
     """Test the ChemistryBiology class."""
 
-    def setup_class(self) -> None:
-        """Create ChemistryBiology instance."""
-        self.chem_bio = ChemistryBiology()
+    @pytest.fixture(autouse=True)
+    def _setup(self, chem_bio: ChemistryBiology) -> None:
+        """Use the shared ChemistryBiology instance."""
+        self.chem_bio = chem_bio
 
     def test_analytes(self) -> None:
         """Test ChemistryBiology.analytes()."""
@@ -37,7 +38,9 @@ class TestChemBio:
 
     def test_domain(self) -> None:
         """Test ChemistryBiology.DOMAIN class attribute."""
-        chem_bio, phys, rad = sorted(self.chem_bio.domains())
+        domains = {d.code: d for d in self.chem_bio.domains()}
+        assert len(domains) == 3
+        chem_bio = domains["CHEM-BIO"]
         assert chem_bio == self.chem_bio.DOMAIN
         assert chem_bio.code == "CHEM-BIO"
         assert chem_bio.name == "Chemistry and Biology"
@@ -204,14 +207,13 @@ class TestChemBio:
         assert result.nmi_code == "MIKES-SYKE"
         assert result.measurement_technique == "Double ID-ICP-MS, Pycnometric density measurement"
 
+    @pytest.mark.usefixtures("no_reply")
     def test_timeout(self) -> None:
         """Test timeout error message."""
         original = self.chem_bio.timeout
 
-        # Making the timeout value be around 1 second causes a TimeoutError
-        # instead of a urllib.error.URLError if it is too small
-        self.chem_bio.timeout = 0.9
-        with pytest.raises(TimeoutError, match=r"No reply from KCDB server after 0.9 seconds"):
+        self.chem_bio.timeout = 0.1
+        with pytest.raises(TimeoutError, match=r"No reply from KCDB server after 0.1 seconds"):
             self.chem_bio.search()
 
         self.chem_bio.timeout = original
@@ -1,18 +1,30 @@
+from __future__ import annotations
+
 from datetime import date
+from http.client import RemoteDisconnected
+from typing import TYPE_CHECKING
 
 import pytest
 
-from msl.kcdb import ChemistryBiology, GeneralPhysics, IonizingRadiation
-from msl.kcdb.classes import Country
+from msl.kcdb import ChemistryBiology, GeneralPhysics, IonizingRadiation, http
+from msl.kcdb.classes import Branch, Country, MetrologyArea, Service, SubService
+
+if TYPE_CHECKING:
+    from .conftest import FakeKCDB
 
 
 class TestGeneralPhysics:
     """Test the GeneralPhysics class."""
 
-    def setup_class(self) -> None:
-        """Create GeneralPhysics instance."""
-        self.physics = GeneralPhysics()
-        self.metrology_areas = self.physics.metrology_areas()
+    @pytest.fixture(autouse=True)
+    def _setup(self, physics: GeneralPhysics) -> None:
+        """Use the shared GeneralPhysics instance."""
+        self.physics = physics
+
+    @property
+    def metrology_areas(self) -> list[MetrologyArea]:
+        """The General Physics metrology areas, only requested by the tests that use them."""
+        return self.physics.metrology_areas()
 
     def test_branches(self) -> None:
         """Test GeneralPhysics.branches()."""
@@ -30,23 +42,23 @@ class TestGeneralPhysics:
         assert t.metrology_area.label == "TF"
         assert t.metrology_area.value == "Time and Frequency"
 
-    def test_branches_chem_bio(self) -> None:
+    def test_branches_chem_bio(self, chem_bio: ChemistryBiology) -> None:
         """Test GeneralPhysics.branches() for Chemistry and Biology areas."""
-        chem_bio = ChemistryBiology()
         for area in chem_bio.metrology_areas():
             branches = self.physics.branches(area)
             assert not branches
 
-    def test_branches_radiation(self) -> None:
+    def test_branches_radiation(self, radiation: IonizingRadiation) -> None:
         """Test GeneralPhysics.branches() for Ionizing Radiation areas."""
-        rad = IonizingRadiation()
-        for area in rad.metrology_areas():
+        for area in radiation.metrology_areas():
             branches = self.physics.branches(area)
             assert not branches
 
     def test_domain(self) -> None:
         """Test GeneralPhysics.DOMAIN class attribute."""
-        chem_bio, phys, rad = sorted(self.physics.domains())
+        domains = {d.code: d for d in self.physics.domains()}
+        assert len(domains) == 3
+        phys = domains["PHYSICS"]
         assert phys == self.physics.DOMAIN
         assert phys.code == "PHYSICS"
         assert phys.name == "General physics"
@@ -77,6 +89,28 @@ class TestGeneralPhysics:
         assert counter.sub_service.service.branch.id == 27
         assert counter.sub_service.service.branch.metrology_area.id == 7
 
+    def test_individual_services_error(self, fake_kcdb: FakeKCDB, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that an error, other than HTTP error 404, is raised by GeneralPhysics.individual_services()."""
+
+        def get(*args: object, **kwargs: object) -> None:  # noqa: ARG001
+            msg = "Remote end closed connection without response"
+            raise RemoteDisconnected(msg)
+
+        physics = GeneralPhysics()
+        area = MetrologyArea(id=5, label="L", value="Length", domain=physics.DOMAIN)
+        branch = Branch(id=23, label="L/DimMet", value="Dimensional metrology", metrology_area=area)
+        service = Service(id=40, label="7", value="Various dimensional", branch=branch, physics_code="7")
+        sub_services = [SubService(id=i, label="7", value="", service=service, physics_code="7.7") for i in (104, 218)]
+        with monkeypatch.context() as m:
+            m.setattr(http, "get", get)
+            for sub_service in sub_services:
+                with pytest.raises(RemoteDisconnected):
+                    physics.individual_services(sub_service)
+
+        # the error is not remembered as "no individual services", so the request is sent again
+        assert physics.individual_services(sub_services[0]) == []
+        assert len(fake_kcdb.requested) == 1
+
     def test_individual_services_no_http_404_error(self) -> None:
         """Test GeneralPhysics.individual_services() for HTTP 404 error."""
         areas = self.physics.filter(self.metrology_areas, "L")
@@ -91,6 +125,19 @@ class TestGeneralPhysics:
         individual_services = self.physics.individual_services(sub_services[0])
         assert not individual_services
 
+    def test_individual_services_not_found(self, fake_kcdb: FakeKCDB) -> None:
+        """Test that an HTTP 404 error for the individual services is cached."""
+        physics = GeneralPhysics()
+        area = MetrologyArea(id=5, label="L", value="Length", domain=physics.DOMAIN)
+        branch = Branch(id=23, label="L/DimMet", value="Dimensional metrology", metrology_area=area)
+        service = Service(id=40, label="7", value="Various dimensional", branch=branch, physics_code="7")
+        sub_service = SubService(id=104, label="7", value="Not attributed 1", service=service, physics_code="7.7")
+
+        # the request that returns HTTP error 404 is only sent once
+        for _ in range(3):
+            assert physics.individual_services(sub_service) == []
+        assert len(fake_kcdb.requested) == 1
+
     def test_metrology_area(self) -> None:
         """Test GeneralPhysics.metrology_areas()."""
         assert len(self.metrology_areas) == 7
@@ -102,6 +149,15 @@ class TestGeneralPhysics:
         assert therm.domain.code == "PHYSICS"
         assert therm.domain.name == "General physics"
 
+    def test_other_domains(self, fake_kcdb: FakeKCDB) -> None:
+        """Test that the branches and services of other domains are not requested."""
+        physics = GeneralPhysics()
+        for domain in (ChemistryBiology.DOMAIN, IonizingRadiation.DOMAIN):
+            area = MetrologyArea(id=9, label="RI", value="Ionizing Radiation", domain=domain)
+            assert physics.branches(area) == []
+            assert physics.services(Branch(id=32, label="DOS", value="Dosimetry", metrology_area=area)) == []
+        assert not fake_kcdb.requested
+
     def test_repr(self) -> None:
         """Test string representation."""
         assert str(self.physics) == "GeneralPhysics(code='PHYSICS', name='General physics')"
@@ -235,9 +291,8 @@ class TestGeneralPhysics:
         assert service.branch.id == 27
         assert service.branch.metrology_area.id == 7
 
-    def test_services_radiation_branches(self) -> None:
+    def test_services_radiation_branches(self, radiation: IonizingRadiation) -> None:
         """Test GeneralPhysics.services() for Ionizing Radiation branches."""
-        radiation = IonizingRadiation()
         for area in radiation.metrology_areas():
             for branch in radiation.branches(area):
                 assert not self.physics.services(branch)
@@ -264,14 +319,65 @@ class TestGeneralPhysics:
         assert meter.service.branch.id == 27
         assert meter.service.branch.metrology_area.id == 7
 
+    @pytest.mark.usefixtures("no_reply")
     def test_timeout(self) -> None:
         """Test timeout error message."""
         original = self.physics.timeout
 
-        # Making the timeout value be around 1 second causes a TimeoutError
-        # instead of a urllib.error.URLError if it is too small
-        self.physics.timeout = 0.9
-        with pytest.raises(TimeoutError, match=r"No reply from KCDB server after 0.9 seconds"):
+        self.physics.timeout = 0.1
+        with pytest.raises(TimeoutError, match=r"No reply from KCDB server after 0.1 seconds"):
             self.physics.search("M")
 
         self.physics.timeout = original
+
+    def test_tree(self, fake_kcdb: FakeKCDB) -> None:
+        """Test GeneralPhysics.tree()."""
+        fake_kcdb.add(
+            "branch?areaId=7",
+            [
+                {"id": 27, "label": "TF/F", "value": "Frequency"},
+                {"id": 28, "label": "TF/TI", "value": "Time interval"},
+            ],
+        )
+        fake_kcdb.add("service?branchId=27", [{"id": 55, "label": "2", "value": "Frequency"}])
+        fake_kcdb.add("service?branchId=28", [])
+        fake_kcdb.add(
+            "subService?serviceId=55",
+            [
+                {"id": 216, "label": "1", "value": "Frequency standard"},
+                {"id": 218, "label": "3", "value": "Frequency meter"},
+            ],
+        )
+        fake_kcdb.add("individualService?subServiceId=216", [])
+        fake_kcdb.add(
+            "individualService?subServiceId=218",
+            [
+                {"id": 546, "label": "1", "value": "Frequency counter"},
+                {"id": 547, "label": "2", "value": "Frequency meter"},
+            ],
+        )
+
+        physics = GeneralPhysics()
+        area = MetrologyArea(id=7, label="TF", value="Time and Frequency", domain=physics.DOMAIN)
+        tree = physics.tree(area)
+        assert len(fake_kcdb.requested) == 6
+
+        (frequency, f_services), (interval, ti_services) = tree.items()
+        assert frequency.label == "TF/F"
+        assert interval.label == "TF/TI"
+        assert ti_services == {}
+
+        ((service, sub_services),) = f_services.items()
+        assert service.physics_code == "2"
+        assert service.branch == frequency
+
+        (standard, standard_individual), (meter, meter_individual) = sub_services.items()
+        assert standard.physics_code == "2.1"
+        assert standard_individual == []
+        assert meter.physics_code == "2.3"
+        assert [i.physics_code for i in meter_individual] == ["2.3.1", "2.3.2"]
+        assert meter_individual[0].sub_service == meter
+
+        # the tree is cached
+        assert physics.tree(area) == tree
+        assert len(fake_kcdb.requested) == 6
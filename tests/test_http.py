@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import gc
+import gzip
+import json
+import subprocess
+import sys
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPException
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+
+import pytest
+
+from msl.kcdb import http
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Handle requests to a local HTTP server."""
+
+    protocol_version = "HTTP/1.1"
+    clients: list[tuple[str, int]] = []  # noqa: RUF012
+    requests: list[tuple[str, str, str | None]] = []  # noqa: RUF012
+
+    def log_message(self, *args: object) -> None:
+        """Do not log requests."""
+
+    def send(self, code: int, obj: object) -> None:
+        """Send a JSON response."""
+        self.clients.append(self.client_address)
+        self.requests.append((self.command, self.path, self.headers["Proxy-Authorization"]))
+        body = json.dumps(obj).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        if self.path.startswith("/gzip") and "gzip" in self.headers["Accept-Encoding"]:
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def redirect(self) -> None:
+        """Redirect /redirect/<code>/<path> to /<path>."""
+        _, _, code, path = self.path.split("/", 3)
+        self.requests.append((self.command, self.path, None))
+        self.send_response(int(code))
+        self.send_header("Location", f"/{path}")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_CONNECT(self) -> None:
+        """Handle a request to tunnel a connection through a proxy."""
+        self.send(502, {})
+
+    def do_GET(self) -> None:
+        """Handle a GET request."""
+        if self.path.startswith("/slow"):
+            time.sleep(0.5)
+        if self.path.startswith("/missing"):
+            self.send(404, {})
+        elif self.path.startswith("/redirect"):
+            self.redirect()
+        else:
+            self.send(200, {"path": self.path})
+
+    def do_POST(self) -> None:
+        """Handle a POST request."""
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path.startswith("/redirect"):
+            self.redirect()
+        else:
+            self.send(200, {"path": self.path, "json": json.loads(body)})
+
+
+@pytest.fixture
+def url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    Handler.clients.clear()
+    Handler.requests.clear()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_get(url: str) -> None:
+    response = http.get(f"{url}/get", params={"areaId": 1, "domainCode": "PHYSICS"})
+    assert response.ok
+    assert response.json() == {"path": "/get?areaId=1&domainCode=PHYSICS"}
+
+    response = http.get(f"{url}/get", params={"keywords": "phase OR test&more"})
+    assert response.json() == {"path": "/get?keywords=phase+OR+test%26more"}
+
+
+def test_post(url: str) -> None:
+    response = http.post(f"{url}/post", json={"page": 0, "countries": ["CH", "FR"]})
+    assert response.ok
+    assert response.json() == {"path": "/post", "json": {"page": 0, "countries": ["CH", "FR"]}}
+
+
+def test_gzip(url: str) -> None:
+    response = http.get(f"{url}/gzip")
+    assert response.ok
+    assert response.json() == {"path": "/gzip"}
+
+
+def test_proxy(url: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in ("http_proxy", "https_proxy", "no_proxy", "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("http_proxy", url.replace("http://", "http://user:p%40ss@"))
+    monkeypatch.setenv("https_proxy", url)
+
+    # the proxy forwards a request to an HTTP server
+    response = http.get("http://kcdb.invalid/get", params={"areaId": 1})
+    assert response.json() == {"path": "http://kcdb.invalid/get?areaId=1"}
+    assert Handler.requests.pop() == ("GET", "http://kcdb.invalid/get?areaId=1", "Basic dXNlcjpwQHNz")
+
+    # the proxy tunnels a connection to an HTTPS server
+    with pytest.raises(OSError, match=r"Tunnel connection failed: 502"):
+        http.get("https://kcdb.invalid/get")
+    assert Handler.requests.pop() == ("CONNECT", "kcdb.invalid:443", None)
+
+    # the proxy is bypassed
+    monkeypatch.setenv("no_proxy", "kcdb.invalid,127.0.0.1")
+    with pytest.raises(OSError):  # noqa: PT011
+        http.get("http://kcdb.invalid/get", timeout=5)
+    assert http.get(f"{url}/get").json() == {"path": "/get"}
+    assert Handler.requests.pop() == ("GET", "/get", None)
+
+
+def test_raise_for_status(url: str) -> None:
+    response = http.get(f"{url}/missing")
+    assert not response.ok
+    with pytest.raises(HTTPException, match=r"Client Error 404"):
+        response.raise_for_status()
+
+
+def test_keep_alive(url: str) -> None:
+    for _ in range(5):
+        assert http.get(f"{url}/get").ok
+    assert len(Handler.clients) == 5
+    assert len(set(Handler.clients)) == 1
+
+
+def test_keep_alive_closed_by_server(url: str) -> None:
+    Handler.timeout = 0.1  # the server closes an idle connection
+    try:
+        assert http.get(f"{url}/get").ok
+        time.sleep(0.3)
+        assert http.get(f"{url}/get").ok
+    finally:
+        Handler.timeout = None
+    assert len(set(Handler.clients)) == 2
+
+
+def test_redirect(url: str) -> None:
+    response = http.get(f"{url}/redirect/301/get")
+    assert response.ok
+    assert response.json() == {"path": "/get"}
+    assert [path for _, path, _ in Handler.requests] == ["/redirect/301/get", "/get"]
+
+    # a POST request that is redirected by 302 or 303 becomes a GET request
+    for code in (302, 303):
+        assert http.post(f"{url}/redirect/{code}/get", json={"page": 0}).json() == {"path": "/get"}
+        assert Handler.requests[-1] == ("GET", "/get", None)
+
+    # a POST request that is redirected by 307 or 308 is still a POST request
+    for code in (307, 308):
+        response = http.post(f"{url}/redirect/{code}/post", json={"page": 0})
+        assert response.json() == {"path": "/post", "json": {"page": 0}}
+
+    with pytest.raises(HTTPException, match=r"Too many redirects"):
+        http.get(f"{url}{'/redirect/302' * 11}/get")
+
+
+def test_timeout(url: str) -> None:
+    with pytest.raises(TimeoutError, match=r"No reply from KCDB server after 0.1 seconds"):
+        http.get(f"{url}/slow", timeout=0.1)
+
+    # the connection that timed out is not reused
+    assert http.get(f"{url}/get").ok
+
+
+def test_thread_connections_closed(url: str) -> None:
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", ResourceWarning)
+        for _ in range(3):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                assert all(r.ok for r in executor.map(http.get, [f"{url}/get"] * 20))
+        gc.collect()
+
+    # each thread reuses its connection and the connection is closed when the thread exits
+    assert len(set(Handler.clients)) <= 12
+    assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+
+def test_connections_closed_at_exit(url: str) -> None:
+    code = f"from msl.kcdb import http; assert http.get({url!r} + '/get').ok"
+    p = subprocess.run([sys.executable, "-X", "dev", "-c", code], capture_output=True, text=True, check=False)  # noqa: S603
+    assert p.returncode == 0, p.stderr
+    assert "ResourceWarning" not in p.stderr
@@ -1,24 +1,36 @@
+from __future__ import annotations
+
 from datetime import date
+from typing import TYPE_CHECKING
 
 import pytest
 
 from msl.kcdb import ChemistryBiology, GeneralPhysics, IonizingRadiation
-from msl.kcdb.classes import Country
+from msl.kcdb.classes import Branch, Country, MetrologyArea
+
+if TYPE_CHECKING:
+    from .conftest import FakeKCDB
 
 
 class TestIonizingRadiation:
     """Test the IonizingRadiation class."""
 
-    def setup_class(self) -> None:
-        """Create IonizingRadiation instance."""
-        self.radiation = IonizingRadiation()
-        self.metrology_areas = self.radiation.metrology_areas()
-        assert len(self.metrology_areas) == 1
-        self.branches = self.radiation.branches(self.metrology_areas[0])
+    @pytest.fixture(autouse=True)
+    def _setup(self, radiation: IonizingRadiation) -> None:
+        """Use the shared IonizingRadiation instance."""
+        self.radiation = radiation
 
-        p = GeneralPhysics()
-        self.physics_branches = [b for a in p.metrology_areas() for b in p.branches(a)]
-        assert len(self.physics_branches) == 32
+    @property
+    def branches(self) -> list[Branch]:
+        """The Ionizing Radiation branches, only requested by the tests that use them."""
+        return self.radiation.branches(self.metrology_areas[0])
+
+    @property
+    def metrology_areas(self) -> list[MetrologyArea]:
+        """The Ionizing Radiation metrology areas, only requested by the tests that use them."""
+        areas = self.radiation.metrology_areas()
+        assert len(areas) == 1
+        return areas
 
     def test_branches(self) -> None:
         """Test IonizingRadiation.branches()."""
@@ -33,23 +45,48 @@ class TestIonizingRadiation:
         assert neu.metrology_area.label == "RI"
         assert neu.metrology_area.value == "Ionizing Radiation"
 
-    def test_branches_chem_bio_areas(self) -> None:
+    def test_branches_chem_bio_areas(self, chem_bio: ChemistryBiology) -> None:
         """Test IonizingRadiation.branches() for Chemistry and Biology areas."""
-        chem_bio = ChemistryBiology()
         for area in chem_bio.metrology_areas():
             branches = self.radiation.branches(area)
             assert not branches
 
-    def test_branches_physics_areas(self) -> None:
+    def test_branches_physics_areas(self, physics: GeneralPhysics) -> None:
         """Test IonizingRadiation.branches() for General Physics areas."""
-        physics = GeneralPhysics()
         for area in physics.metrology_areas():
             branches = self.radiation.branches(area)
             assert not branches
 
+    @pytest.mark.parametrize(
+        ("label", "mediums", "quantities", "sources"),
+        [
+            ("RAD", [1, 16], [32, 35], [32]),
+            ("DOS", [17], [1, 16, 17, 24], [1, 16, 17, 24]),
+            ("NEU", [24, 32, 35, 47, 78], [47], [35, 47, 78]),
+            ("EM/RF", [], [], []),
+        ],
+    )
+    def test_branch_id_ranges(
+        self, fake_kcdb: FakeKCDB, label: str, mediums: list[int], quantities: list[int], sources: list[int]
+    ) -> None:
+        """Test that the mediums, quantities and sources are selected by the id range of a branch."""
+        ids = [1, 16, 17, 24, 32, 35, 47, 78]
+        fake_kcdb.add("radiationMedium", [{"id": i, "label": str(i), "value": ""} for i in ids])
+        fake_kcdb.add("quantity", [{"id": i, "label": str(i), "value": ""} for i in ids])
+        fake_kcdb.add("radiationSource", [{"id": i, "label": str(i), "value": ""} for i in ids])
+
+        radiation = IonizingRadiation()
+        area = MetrologyArea(id=9, label="RI", value="Ionizing Radiation", domain=radiation.DOMAIN)
+        branch = Branch(id=0, label=label, value="", metrology_area=area)
+        assert [m.id for m in radiation.mediums(branch)] == mediums
+        assert [q.id for q in radiation.quantities(branch)] == quantities
+        assert [s.id for s in radiation.sources(branch)] == sources
+
     def test_domain(self) -> None:
         """Test IonizingRadiation.DOMAIN class attribute."""
-        chem_bio, phys, rad = sorted(self.radiation.domains())
+        domains = {d.code: d for d in self.radiation.domains()}
+        assert len(domains) == 3
+        rad = domains["RADIATION"]
         assert rad == self.radiation.DOMAIN
         assert rad.code == "RADIATION"
         assert rad.name == "Ionizing radiation"
@@ -93,9 +130,10 @@ class TestIonizingRadiation:
         assert medium.label == "5"
         assert medium.value == "Aerosol"
 
-    def test_mediums_physics_branches(self) -> None:
+    def test_mediums_physics_branches(self, physics_branches: list[Branch]) -> None:
         """Test IonizingRadiation.mediums() for General Physics branches."""
-        for branch in self.physics_branches:
+        assert len(physics_branches) == 32
+        for branch in physics_branches:
             mediums = self.radiation.mediums(branch)
             assert not mediums
 
@@ -120,6 +158,14 @@ class TestIonizingRadiation:
         assert nuclide.label == "Ce-144"
         assert nuclide.value == "Ce-144"
 
+    def test_other_domains(self, fake_kcdb: FakeKCDB) -> None:
+        """Test that the branches of other domains are not requested."""
+        radiation = IonizingRadiation()
+        for domain in (ChemistryBiology.DOMAIN, GeneralPhysics.DOMAIN):
+            area = MetrologyArea(id=7, label="TF", value="Time and Frequency", domain=domain)
+            assert radiation.branches(area) == []
+        assert not fake_kcdb.requested
+
     def test_repr(self) -> None:
         """Test string representation."""
         assert str(self.radiation) == "IonizingRadiation(code='RADIATION', name='Ionizing radiation')"
@@ -256,9 +302,9 @@ class TestIonizingRadiation:
         assert source.label == "3"
         assert source.value == "K x-rays"
 
-    def test_sources_physics_branches(self) -> None:
+    def test_sources_physics_branches(self, physics_branches: list[Branch]) -> None:
         """Test IonizingRadiation.sources() for General Physics branches."""
-        for branch in self.physics_branches:
+        for branch in physics_branches:
             sources = self.radiation.sources(branch)
             assert not sources
 
@@ -301,20 +347,19 @@ class TestIonizingRadiation:
         assert quantity.label == "3"
         assert quantity.value == "Activity per unit area"
 
-    def test_quantities_physics_branches(self) -> None:
+    def test_quantities_physics_branches(self, physics_branches: list[Branch]) -> None:
         """Test IonizingRadiation.quantities() for General Physics branches."""
-        for branch in self.physics_branches:
+        for branch in physics_branches:
             quantities = self.radiation.quantities(branch)
             assert not quantities
 
+    @pytest.mark.usefixtures("no_reply")
     def test_timeout(self) -> None:
         """Test timeout error message."""
         original = self.radiation.timeout
 
-        # Making the timeout value be around 1 second causes a TimeoutError
-        # instead of a urllib.error.URLError if it is too small
-        self.radiation.timeout = 0.9
-        with pytest.raises(TimeoutError, match=r"No reply from KCDB server after 0.9 seconds"):
+        self.radiation.timeout = 0.1
+        with pytest.raises(TimeoutError, match=r"No reply from KCDB server after 0.1 seconds"):
             self.radiation.search()
 
         self.radiation.timeout = original
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import re
+from http.client import HTTPException
+from typing import TYPE_CHECKING
+
 import pytest
 
-from msl.kcdb.classes import KCDB, Service
+from msl.kcdb.classes import KCDB, Country, Domain, Service
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .conftest import FakeKCDB
 
 
 class TestKCDB:
@@ -12,6 +21,94 @@ class TestKCDB:
         """Create KCDB instance."""
         self.kcdb = KCDB()
 
+    def test_cache_dir(self, fake_kcdb: FakeKCDB, tmp_path: Path) -> None:
+        """Test that reference data is cached to disk."""
+        fake_kcdb.add("domain", [{"code": "PHYSICS", "name": "General physics"}], key="domains")
+        requested = fake_kcdb.requested
+        kcdb = KCDB(cache_dir=tmp_path)
+        physics = Domain(code="PHYSICS", name="General physics")
+        assert kcdb.domains() == [physics]
+        assert kcdb.domains() == [physics]
+        assert len(requested) == 1
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        # another instance uses the same cache directory
+        assert KCDB(cache_dir=tmp_path).domains() == [physics]
+        assert len(requested) == 1
+
+        # cached data has expired
+        assert KCDB(cache_dir=tmp_path, cache_ttl=0).domains() == [physics]
+        assert len(requested) == 2
+
+    def test_cache_dir_allow_stale(self, fake_kcdb: FakeKCDB, tmp_path: Path) -> None:
+        """Test that expired reference data is returned if the KCDB server cannot be reached."""
+        fake_kcdb.add("domain", [{"code": "PHYSICS", "name": "General physics"}], key="domains")
+        assert len(KCDB(cache_dir=tmp_path).domains()) == 1
+
+        fake_kcdb.remove("domain")
+        with pytest.raises(HTTPException, match=r"Client Error 404"):
+            KCDB(cache_dir=tmp_path, cache_ttl=0).domains()
+
+        assert len(KCDB(cache_dir=tmp_path, cache_ttl=0, allow_stale=True).domains()) == 1
+
+        # nothing to fall back to
+        with pytest.raises(HTTPException, match=r"Client Error 404"):
+            KCDB(allow_stale=True).domains()
+
+        # the server replies with a page that is not JSON, e.g., during maintenance
+        fake_kcdb.add("domain", b"<html>Under maintenance</html>")
+        assert len(KCDB(cache_dir=tmp_path, cache_ttl=0, allow_stale=True).domains()) == 1
+        with pytest.raises(ValueError):  # noqa: PT011
+            KCDB(cache_dir=tmp_path, cache_ttl=0).domains()
+
+    def test_cache_dir_invalid(self, fake_kcdb: FakeKCDB, tmp_path: Path) -> None:
+        """Test that a response or a cache file that is not valid JSON is never used as cached data."""
+        fake_kcdb.add("domain", b"<html>Under maintenance</html>")
+        requested = fake_kcdb.requested
+        with pytest.raises(ValueError):  # noqa: PT011
+            KCDB(cache_dir=tmp_path).domains()
+        assert list(tmp_path.glob("*.json")) == []
+
+        # the server is back
+        fake_kcdb.add("domain", [{"code": "PHYSICS", "name": "General physics"}], key="domains")
+        assert len(KCDB(cache_dir=tmp_path).domains()) == 1
+        assert len(requested) == 2
+
+        # a corrupt cache file is ignored and is replaced
+        (file,) = tmp_path.glob("*.json")
+        file.write_bytes(b"{not json")
+        assert len(KCDB(cache_dir=tmp_path).domains()) == 1
+        assert len(requested) == 3
+        assert len(KCDB(cache_dir=tmp_path).domains()) == 1
+        assert len(requested) == 3
+
+        # a corrupt cache file is not a stale fallback
+        file.write_bytes(b"{not json")
+        fake_kcdb.remove("domain")
+        with pytest.raises(HTTPException, match=r"Client Error 404"):
+            KCDB(cache_dir=tmp_path, cache_ttl=0, allow_stale=True).domains()
+
+    def test_cache_dir_none(self, fake_kcdb: FakeKCDB) -> None:
+        """Test that reference data is not cached to disk by default."""
+        fake_kcdb.add("domain", [{"code": "PHYSICS", "name": "General physics"}], key="domains")
+        requested = fake_kcdb.requested
+        assert len(KCDB().domains()) == 1
+        assert len(KCDB().domains()) == 1
+        assert len(requested) == 2
+
+    def test_cache_memory(self, fake_kcdb: FakeKCDB) -> None:
+        """Test that reference data is cached in memory."""
+        fake_kcdb.add("domain", [{"code": "PHYSICS", "name": "General physics"}], key="domains")
+        requested = fake_kcdb.requested
+        kcdb = KCDB()
+        for _ in range(5):
+            assert len(kcdb.domains()) == 1
+        assert len(requested) == 1
+
+        kcdb.clear_cache()
+        assert len(kcdb.domains()) == 1
+        assert len(requested) == 2
+
     def test_countries(self) -> None:
         """Test KCDB.countries()."""
         countries = self.kcdb.countries()
@@ -33,6 +130,20 @@ class TestKCDB:
         assert rad.code == "RADIATION"
         assert rad.name == "Ionizing radiation"
 
+    def test_filter(self) -> None:
+        """Test KCDB.filter() with a string and with a compiled pattern."""
+        countries = [
+            Country(id=29, label="FR", value="France"),
+            Country(id=58, label="NZ", value="New Zealand"),
+        ]
+        assert KCDB.filter(countries, "NZ") == countries[1:]
+        assert KCDB.filter(countries, "New Zealand") == countries[1:]
+        assert KCDB.filter(countries, "New.Zealand") == countries[1:]
+        assert KCDB.filter(countries, "new") == []
+        assert KCDB.filter(countries, "new", flags=re.IGNORECASE) == countries[1:]
+        assert KCDB.filter(countries, re.compile("^F")) == countries[:1]
+        assert KCDB.filter(countries, re.compile("an")) == countries
+
     def test_invalid_page_value(self) -> None:
         """Test page value invalid."""
         with pytest.raises(ValueError, match=r"Must be >= 0"):
@@ -56,8 +167,10 @@ class TestKCDB:
 
     def test_quick_search(self) -> None:
         """Test KCDB.quick_search()."""
+        # only the totals, filters and aggregations are checked, so request a single element
         quick = self.kcdb.quick_search(
             keywords="phase OR test",
+            page_size=1,
             included_filters=[
                 "cmcDomain.CHEM-BIO",
                 "cmcBranches.Dimensional metrology",
@@ -118,14 +231,13 @@ class TestKCDB:
         self.kcdb.timeout = None
         assert self.kcdb.timeout is None
 
-        # make sure that get(url, timeout=None) is okay
+        # make sure that get(url, timeout=None) is okay (the domains may already be cached by test_domains)
+        self.kcdb.clear_cache()
         assert len(self.kcdb.domains()) == 3
 
         self.kcdb.timeout = -1
         assert self.kcdb.timeout is None
 
-        # Making the timeout value be very small causes a urllib.error.URLError
-        # instead of a TimeoutError
         self.kcdb.timeout = 0.01
         with pytest.raises(TimeoutError, match=r"No reply from KCDB server after 0.01 seconds"):
             self.kcdb.quick_search()